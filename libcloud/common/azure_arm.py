@@ -144,6 +144,9 @@ class AzureResourceManagementConnection(ConnectionUserAndKey):
     responseCls = AzureJsonResponse
     rawResponseCls = RawResponse
 
+    access_token = None
+    expires_on = 0
+
     def __init__(
         self,
         key,
@@ -209,16 +212,23 @@ class AzureResourceManagementConnection(ConnectionUserAndKey):
         self.expires_on = js.object["expires_on"]
 
     def connect(self, **kwargs):
-        self.get_token_from_credentials()
+        # Token might have already been obtained by the request which
+        # triggered the connection
+        if self._token_expires_soon():
+            self.get_token_from_credentials()
+
         return super(AzureResourceManagementConnection, self).connect(**kwargs)
 
+    def _token_expires_soon(self):
+        return (time.time() + 300) >= int(self.expires_on)
+
     def request(
         self, action, params=None, data=None, headers=None, method="GET", raw=False
     ):
 
         # Log in again if the token has expired or is going to expire soon
         # (next 5 minutes).
-        if (time.time() + 300) >= int(self.expires_on):
+        if self._token_expires_soon():
             self.get_token_from_credentials()
 
         return super(AzureResourceManagementConnection, self).request(
@@ -19,12 +19,24 @@ from typing import Optional
 
 import json
 import os
+import re
 import ssl
 import socket
-import copy
 import binascii
+import threading
 import time
 
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import orjson
+
+    have_orjson = True
+except ImportError:
+    have_orjson = False
+
 from libcloud.utils.py3 import ET
 
 import libcloud
@@ -64,6 +76,102 @@ RETRY_FAILED_HTTP_REQUESTS = False
 # We default it to False for backward compatibility reasons.
 ALLOW_PATH_DOUBLE_SLASHES = False
 
+# Header which is sent with every request to indicate that we support gzip
+# and deflate compression
+_DEFAULT_ENCODING_HEADER = {"Accept-Encoding": "gzip,deflate"}
+
+# HTTP status codes which indicate a successful response
+_SUCCESS_STATUSES = frozenset((httplib.OK, httplib.CREATED, httplib.ACCEPTED))
+
+
+def _lowercase_headers(headers):
+    """
+    Return a new dictionary with all the header names lowercased.
+
+    :param headers: Response headers.
+    :type headers: ``dict``
+
+    :rtype: ``dict``
+    """
+    if isinstance(headers, CaseInsensitiveDict):
+        # requests already stores the lowercased header names
+        return dict(headers.lower_items())
+
+    return lowercase_keys(dict(headers))
+
+
+# Random bytes used for cache busting values. Bytes are read from os.urandom()
+# in batches instead of issuing a system call for each request.
+_CACHE_BUSTING_POOL = bytearray()
+_CACHE_BUSTING_POOL_SIZE = 512
+_CACHE_BUSTING_VALUE_SIZE = 8
+_CACHE_BUSTING_LOCK = threading.Lock()
+
+
+def _reset_cache_busting_pool():
+    """
+    Reset cache busting state in a forked child process.
+
+    Forked processes shouldn't reuse values from the parent process and the
+    lock is replaced since it could have been held by another thread of the
+    parent process at the time of the fork.
+    """
+    global _CACHE_BUSTING_LOCK
+
+    _CACHE_BUSTING_LOCK = threading.Lock()
+    _CACHE_BUSTING_POOL.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_cache_busting_pool)
+
+
+def _get_cache_busting_value():
+    """
+    Return a random hex string which is used as a cache busting value.
+
+    :rtype: ``str``
+    """
+    with _CACHE_BUSTING_LOCK:
+        if len(_CACHE_BUSTING_POOL) < _CACHE_BUSTING_VALUE_SIZE:
+            _CACHE_BUSTING_POOL.extend(os.urandom(_CACHE_BUSTING_POOL_SIZE))
+
+        value = _CACHE_BUSTING_POOL[:_CACHE_BUSTING_VALUE_SIZE]
+        del _CACHE_BUSTING_POOL[:_CACHE_BUSTING_VALUE_SIZE]
+
+    return binascii.hexlify(value).decode("ascii")
+
+
+# orjson silently converts integers which don't fit into 64 bits to floats.
+# Any integer with up to 18 digits fits, so documents which contain a run of
+# 19 or more digits are always parsed using the json module.
+_LONG_DIGITS_RE = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES_RE = re.compile(rb"\d{19}")
+
+
+def _json_loads(data):
+    """
+    Deserialize a JSON document.
+
+    orjson is used if it's available. We use the json module for documents
+    which may contain integers larger than 64 bits (orjson would return them
+    as floats) and for documents which orjson rejects, but json accepts
+    (e.g. NaN values).
+    """
+    if have_orjson:
+        if isinstance(data, str):
+            has_long_digits = _LONG_DIGITS_RE.search(data)
+        else:
+            has_long_digits = _LONG_DIGITS_BYTES_RE.search(data)
+
+        if not has_long_digits:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+
+    return json.loads(data)
+
 
 class LazyObject(object):
     """An object that doesn't get initialized until accessed."""
@@ -71,26 +179,26 @@ class LazyObject(object):
     @classmethod
     def _proxy(cls, *lazy_init_args, **lazy_init_kwargs):
         class Proxy(cls, object):
-            _lazy_obj = None
-
             def __init__(self):
                 # Must override the lazy_cls __init__
                 pass
 
             def __getattribute__(self, attr):
-                lazy_obj = object.__getattribute__(self, "_get_lazy_obj")()
-                return getattr(lazy_obj, attr)
+                object.__getattribute__(self, "_init_lazy_obj")()
+                return getattr(self, attr)
 
             def __setattr__(self, attr, value):
-                lazy_obj = object.__getattribute__(self, "_get_lazy_obj")()
-                setattr(lazy_obj, attr, value)
-
-            def _get_lazy_obj(self):
-                lazy_obj = object.__getattribute__(self, "_lazy_obj")
-                if lazy_obj is None:
-                    lazy_obj = cls(*lazy_init_args, **lazy_init_kwargs)
-                    object.__setattr__(self, "_lazy_obj", lazy_obj)
-                return lazy_obj
+                object.__getattribute__(self, "_init_lazy_obj")()
+                setattr(self, attr, value)
+
+            def _init_lazy_obj(self):
+                # Once the real object has been created, the proxy turns
+                # itself into an instance of cls which shares the real object
+                # state. This way subsequent attribute access doesn't go
+                # through the proxy anymore.
+                lazy_obj = cls(*lazy_init_args, **lazy_init_kwargs)
+                object.__setattr__(self, "__dict__", lazy_obj.__dict__)
+                object.__setattr__(self, "__class__", cls)
 
         return Proxy()
 
@@ -149,17 +257,16 @@ class Response(object):
 
         # http.client In Python 3 doesn't automatically lowercase the header
         # names
-        self.headers = lowercase_keys(dict(response.headers))
+        self.headers = _lowercase_headers(response.headers)
         self.error = response.reason
         self.status = response.status_code
         self.request = response.request
         self.iter_content = response.iter_content
 
-        self.body = (
-            response.text.strip()
-            if response.text is not None and hasattr(response.text, "strip")
-            else ""
-        )
+        # NOTE: requests decodes the whole body each time "text" is accessed
+        # so we only access it once
+        text = response.text
+        self.body = text.strip() if text is not None and hasattr(text, "strip") else ""
 
         if not self.success():
             raise exception_from_message(
@@ -200,16 +307,7 @@ class Response(object):
         :rtype: ``bool``
         :return: ``True`` or ``False``
         """
-        # pylint: disable=E1101
-        import requests
-
-        return self.status in [
-            requests.codes.ok,
-            requests.codes.created,
-            httplib.OK,
-            httplib.CREATED,
-            httplib.ACCEPTED,
-        ]
+        return self.status in _SUCCESS_STATUSES
 
 
 class JsonResponse(Response):
@@ -222,7 +320,7 @@ class JsonResponse(Response):
             return self.body
 
         try:
-            body = json.loads(self.body)
+            body = _json_loads(self.body)
         except Exception:
             raise MalformedResponseError(
                 "Failed to parse JSON", body=self.body, driver=self.connection.driver
@@ -269,7 +367,7 @@ class RawResponse(Response):
         self._reason = None
         self.connection = connection
         if response is not None:
-            self.headers = lowercase_keys(dict(response.headers))
+            self.headers = _lowercase_headers(response.headers)
             self.error = response.reason
             self.status = response.status_code
             self.request = response.request
@@ -288,16 +386,7 @@ class RawResponse(Response):
         :rtype: ``bool``
         :return: ``True`` or ``False``
         """
-        # pylint: disable=E1101
-        import requests
-
-        return self.status in [
-            requests.codes.ok,
-            requests.codes.created,
-            httplib.OK,
-            httplib.CREATED,
-            httplib.ACCEPTED,
-        ]
+        return self.status in _SUCCESS_STATUSES
 
     @property
     def response(self):
@@ -331,7 +420,6 @@ class Connection(object):
     responseCls = Response
     rawResponseCls = RawResponse
     retryCls = Retry
-    connection = None
     host = "127.0.0.1"  # type: str
     port = 443
     timeout = None  # type: Optional[Union[int, float]]
@@ -342,8 +430,17 @@ class Connection(object):
     backoff = None
     retry_delay = None
 
+    # Cached value of the LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS environment
+    # variable. None means it hasn't been read yet.
+    _retry_env_enabled = None  # type: Optional[bool]
+
+    _user_agent_cache = None  # type: Optional[str]
+    _user_agent_cache_key = None  # type: Optional[tuple]
+
     allow_insecure = True
 
+    _connection = None  # type: Optional[LibcloudConnection]
+
     def __init__(
         self,
         secure=True,
@@ -421,16 +518,16 @@ class Connection(object):
     def _tuple_from_url(self, url):
         secure = 1
         port = None
-        (scheme, netloc, request_path, param, query, fragment) = urlparse.urlparse(url)
+        scheme, netloc, request_path = urlparse.urlsplit(url)[:3]
 
-        if scheme not in ["http", "https"]:
+        if scheme not in ("http", "https"):
             raise LibcloudError("Invalid scheme: %s in url %s" % (scheme, url))
 
         if scheme == "http":
             secure = 0
 
         if ":" in netloc:
-            netloc, port = netloc.rsplit(":")
+            netloc, _, port = netloc.rpartition(":")
             port = int(port)
 
         if not port:
@@ -440,10 +537,31 @@ class Connection(object):
                 port = 443
 
         host = netloc
-        port = int(port)
 
         return (host, port, secure, request_path)
 
+    @property
+    def connection(self):
+        """
+        Underlying HTTP connection.
+
+        Connection is established lazily on first access so drivers which
+        are never used don't pay the cost of setting it up. Call
+        :meth:`connect` to establish it explicitly.
+        """
+        if self._connection is None:
+            self.connect()
+
+        return self._connection
+
+    @connection.setter
+    def connection(self, value):
+        self._connection = value
+
+    @connection.deleter
+    def connection(self):
+        self._connection = None
+
     def connect(self, host=None, port=None, base_url=None, **kwargs):
         """
         Establish a connection with the API server.
@@ -473,26 +591,21 @@ class Connection(object):
         # Make sure port is an int
         port = int(port)
 
-        if not hasattr(kwargs, "host"):
-            kwargs.update({"host": host})
+        kwargs.setdefault("host", host)
+        kwargs.setdefault("port", port)
+        kwargs.setdefault("secure", self.secure)
 
-        if not hasattr(kwargs, "port"):
-            kwargs.update({"port": port})
+        if "key_file" not in kwargs and hasattr(self, "key_file"):
+            kwargs["key_file"] = getattr(self, "key_file")
 
-        if not hasattr(kwargs, "secure"):
-            kwargs.update({"secure": self.secure})
-
-        if not hasattr(kwargs, "key_file") and hasattr(self, "key_file"):
-            kwargs.update({"key_file": getattr(self, "key_file")})
-
-        if not hasattr(kwargs, "cert_file") and hasattr(self, "cert_file"):
-            kwargs.update({"cert_file": getattr(self, "cert_file")})
+        if "cert_file" not in kwargs and hasattr(self, "cert_file"):
+            kwargs["cert_file"] = getattr(self, "cert_file")
 
         if self.timeout:
-            kwargs.update({"timeout": self.timeout})
+            kwargs["timeout"] = self.timeout
 
         if self.proxy_url:
-            kwargs.update({"proxy_url": self.proxy_url})
+            kwargs["proxy_url"] = self.proxy_url
 
         connection = self.conn_class(**kwargs)
         # You can uncoment this line, if you setup a reverse proxy server
@@ -503,7 +616,32 @@ class Connection(object):
 
         self.connection = connection
 
+    def prewarm(self, count):
+        """
+        Open connections to the API server in the background so the
+        following requests don't need to establish them on first use.
+
+        :type count: ``int``
+        :param count: Number of connections to open
+
+        :return: Thread which opens the connections or ``None`` if the
+                 connection pool couldn't be set up.
+        :rtype: :class:`threading.Thread` or ``None``
+        """
+        return self.connection.prewarm(count)
+
     def _user_agent(self):
+        # The user agent only changes when a token is appended or when the
+        # driver is changed so we cache it and only rebuild it when needed
+        cache_key = (self.driver, len(self.ua))
+
+        if self._user_agent_cache_key != cache_key:
+            self._user_agent_cache = self._build_user_agent()
+            self._user_agent_cache_key = cache_key
+
+        return self._user_agent_cache
+
+    def _build_user_agent(self):
         user_agent_suffix = " ".join(["(%s)" % x for x in self.ua])
 
         if self.driver:
@@ -583,20 +721,19 @@ class Connection(object):
         :rtype: :class:`Response` instance
 
         """
-        if params is None:
-            params = {}
-        else:
-            params = copy.copy(params)
-
-        if headers is None:
-            headers = {}
-        else:
-            headers = copy.copy(headers)
+        # NOTE: params can also be a list of (key, value) tuples so we use the
+        # object's own copy() method instead of dict()
+        params = {} if params is None else params.copy()
+        headers = {} if headers is None else headers.copy()
+
+        # The environment variable is only read on the first request made
+        # with this connection
+        if self._retry_env_enabled is None:
+            self._retry_env_enabled = bool(
+                os.environ.get("LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS", False)
+            )
 
-        retry_enabled = (
-            os.environ.get("LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS", False)
-            or RETRY_FAILED_HTTP_REQUESTS
-        )
+        retry_enabled = self._retry_env_enabled or RETRY_FAILED_HTTP_REQUESTS
 
         # Method level argument has precedence over module level constant and
         # environment variable
@@ -619,17 +756,18 @@ class Connection(object):
         headers = self.add_default_headers(headers)
 
         # We always send a user-agent header
-        headers.update({"User-Agent": self._user_agent()})
+        headers["User-Agent"] = self._user_agent()
 
         # Indicate that we support gzip and deflate compression
-        headers.update({"Accept-Encoding": "gzip,deflate"})
+        headers.update(_DEFAULT_ENCODING_HEADER)
 
+        # NOTE: port can also be passed to the constructor as a string
         port = int(self.port)
 
         if port not in (80, 443):
-            headers.update({"Host": "%s:%d" % (self.host, port)})
+            headers["Host"] = f"{self.host}:{port}"
         else:
-            headers.update({"Host": self.host})
+            headers["Host"] = self.host
 
         if data:
             data = self.encode_data(data)
@@ -637,17 +775,11 @@ class Connection(object):
         params, headers = self.pre_connect_hook(params, headers)
 
         if params:
-            if "?" in action:
-                url = "&".join((action, urlencode(params, doseq=True)))
-            else:
-                url = "?".join((action, urlencode(params, doseq=True)))
+            separator = "&" if "?" in action else "?"
+            url = f"{action}{separator}{urlencode(params, doseq=True)}"
         else:
             url = action
 
-        # IF connection has not yet been established
-        if self.connection is None:
-            self.connect()
-
         request_to_be_executed = self._retryable_request
 
         if retry_enabled:
@@ -705,20 +837,17 @@ class Connection(object):
                 )
                 raise socket.gaierror(msg)  # type: ignore
             self.reset_context()
-            raise e
-        except ssl.SSLError as e:
+            raise
+        except ssl.SSLError:
             self.reset_context()
-            raise ssl.SSLError(str(e))
+            raise
 
-        if raw:
-            responseCls = self.rawResponseCls
-            kwargs = {"connection": self, "response": self.connection.getresponse()}
-        else:
-            responseCls = self.responseCls
-            kwargs = {"connection": self, "response": self.connection.getresponse()}
+        responseCls = self.rawResponseCls if raw else self.responseCls
 
         try:
-            response = responseCls(**kwargs)
+            response = responseCls(
+                connection=self, response=self.connection.getresponse()
+            )
         finally:
             # Always reset the context after the request has completed
             self.reset_context()
@@ -740,9 +869,29 @@ class Connection(object):
             # valid - e.g. for S3 paths - /bucket//path1/path2.txt
             return self.request_path + action
 
-        url = urlparse.urljoin(
-            self.request_path.lstrip("/").rstrip("/") + "/", action.lstrip("/")
-        )
+        base_path = self.request_path.strip("/")
+        action = action.lstrip("/")
+        url = base_path + "/" + action if base_path else action
+
+        # urljoin() is only needed to normalize duplicated slashes, dot
+        # segments, params, empty query strings, whitespace and control
+        # characters which urlsplit() strips and values which look like they
+        # contain a scheme or a fragment. Plain paths (the common case) are
+        # simply concatenated.
+        if (
+            "//" in url
+            or "/." in url
+            or url[:1] == "."
+            or ":" in url
+            or "#" in url
+            or ";" in url
+            or url[-1:] == "?"
+            or action[:1] <= " "
+            or "\t" in url
+            or "\r" in url
+            or "\n" in url
+        ):
+            url = urlparse.urljoin(base_path + "/", action)
 
         if not url.startswith("/"):
             return "/" + url
@@ -799,7 +948,7 @@ class Connection(object):
         Note: This should only be used with *naughty* providers which use
         excessive caching of responses.
         """
-        cache_busting_value = binascii.hexlify(os.urandom(8)).decode("ascii")
+        cache_busting_value = _get_cache_busting_value()
 
         if isinstance(params, dict):
             params["cache-busting"] = cache_busting_value
@@ -880,9 +1029,11 @@ class PollingConnection(Connection):
             response=response, context=context, request_kwargs=kwargs
         )
 
-        end = time.time() + self.timeout
+        # NOTE: We use a monotonic clock so the timeout isn't affected by
+        # system clock changes
+        end = time.monotonic() + self.timeout
         completed = False
-        while time.time() < end and not completed:
+        while time.monotonic() < end and not completed:
             response = request(**kwargs)
             completed = self.has_completed(response=response)
             if not completed:
@@ -958,7 +1109,7 @@ class ConnectionKey(Connection):
         Initialize `user_id` and `key`; set `secure` to an ``int`` based on
         passed value.
         """
-        super(ConnectionKey, self).__init__(
+        super().__init__(
             secure=secure,
             host=host,
             port=port,
@@ -992,7 +1143,7 @@ class CertificateConnection(Connection):
         Initialize `cert_file`; set `secure` to an ``int`` based on
         passed value.
         """
-        super(CertificateConnection, self).__init__(
+        super().__init__(
             secure=secure,
             host=host,
             port=port,
@@ -1012,7 +1163,7 @@ class KeyCertificateConnection(CertificateConnection):
     argument.
     """
 
-    key_file = None
+    key_file: str
 
     def __init__(
         self,
@@ -1032,7 +1183,7 @@ class KeyCertificateConnection(CertificateConnection):
         Initialize `cert_file`; set `secure` to an ``int`` based on
         passed value.
         """
-        super(KeyCertificateConnection, self).__init__(
+        super().__init__(
             cert_file,
             secure=secure,
             host=host,
@@ -1052,7 +1203,7 @@ class ConnectionUserAndKey(ConnectionKey):
     Base connection class which accepts a ``user_id`` and ``key`` argument.
     """
 
-    user_id = None  # type: int
+    user_id: int
 
     def __init__(
         self,
@@ -1067,7 +1218,7 @@ class ConnectionUserAndKey(ConnectionKey):
         backoff=None,
         retry_delay=None,
     ):
-        super(ConnectionUserAndKey, self).__init__(
+        super().__init__(
             key,
             secure=secure,
             host=host,
@@ -1081,6 +1232,11 @@ class ConnectionUserAndKey(ConnectionKey):
         self.user_id = user_id
 
 
+# Connection class keyword arguments which can be passed to the driver
+# constructor
+_CONN_KW_NAMES = ("timeout", "retry_delay", "backoff", "proxy_url")
+
+
 class BaseDriver(object):
     """
     Base driver class from which other classes can inherit from.
@@ -1133,15 +1289,19 @@ class BaseDriver(object):
         self.api_version = api_version
         self.region = region
 
+        # Number of connections to open in the background on initialization
+        prewarm = kwargs.pop("prewarm", 0)
+
         conn_kwargs = self._ex_connection_class_kwargs()
-        conn_kwargs.update(
-            {
-                "timeout": kwargs.pop("timeout", None),
-                "retry_delay": kwargs.pop("retry_delay", None),
-                "backoff": kwargs.pop("backoff", None),
-                "proxy_url": kwargs.pop("proxy_url", None),
-            }
-        )
+
+        # Values passed to the constructor take precedence over the ones
+        # returned by "_ex_connection_class_kwargs", unset ones are left to
+        # the connection class defaults
+        for name in _CONN_KW_NAMES:
+            value = kwargs.pop(name, None)
+
+            if value is not None:
+                conn_kwargs[name] = value
 
         args = [self.key]
 
@@ -1160,7 +1320,39 @@ class BaseDriver(object):
 
         self.connection = self.connectionCls(*args, **conn_kwargs)
         self.connection.driver = self
-        self.connection.connect()
+
+        # NOTE: HTTP connection is established lazily on first request
+
+        if prewarm:
+            self.connection.prewarm(prewarm)
+
+    @classmethod
+    def create_many(cls, configs, max_workers=None):
+        """
+        Instantiate multiple drivers concurrently.
+
+        This is useful for drivers which talk to the API when they are
+        instantiated (e.g. to authenticate or to detect the API version) and
+        when connections are pre-warmed using ``prewarm`` argument.
+
+        :param configs: Keyword arguments for each of the driver instances.
+        :type configs: ``list`` of ``dict``
+
+        :param max_workers: Maximum number of threads to use. Defaults to
+                            the number of driver instances (up to 32).
+        :type max_workers: ``int``
+
+        :return: Driver instances in the same order as ``configs``.
+        :rtype: ``list`` of :class:`BaseDriver`
+        """
+        if not configs:
+            return []
+
+        if max_workers is None:
+            max_workers = min(32, len(configs))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda kwargs: cls(**kwargs), configs))
 
     def _ex_connection_class_kwargs(self):
         """
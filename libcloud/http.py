@@ -19,17 +19,26 @@ verification, depending on libcloud.security settings.
 """
 
 import os
+import ssl
+import threading
 import warnings
 import requests
 
+from typing import Dict, Union
+
 from requests.adapters import HTTPAdapter
 
 try:
     # requests no longer vendors urllib3 in newer versions
     # https://github.com/python/typeshed/issues/6893#issuecomment-1012511758
     from urllib3.poolmanager import PoolManager
+    from urllib3.util.ssl_ import create_urllib3_context, resolve_cert_reqs
 except ImportError:
     from requests.packages.urllib3.poolmanager import PoolManager  # type: ignore
+    from requests.packages.urllib3.util.ssl_ import (  # type: ignore
+        create_urllib3_context,
+        resolve_cert_reqs,
+    )
 
 import libcloud.security
 from libcloud.utils.py3 import urlparse, PY3
@@ -45,6 +54,93 @@ DEFAULT_REQUEST_TIMEOUT = 60
 HTTP_PROXY_ENV_VARIABLE_NAME = "http_proxy"
 HTTPS_PROXY_ENV_VARIABLE_NAME = "https_proxy"
 
+# If this environment variable is set, all the connection instances with the
+# same SSL verification settings share a single HTTP adapter and with that, a
+# pool of keep-alive connections. This means a driver can reuse a TCP
+# connection and TLS session which was established by a previous driver
+# instance talking to the same host.
+REUSE_CONNECTIONS_ENV_VARIABLE_NAME = "LIBCLOUD_REUSE_CONNECTIONS"
+
+# Number of host pools and maximum number of idle connections per host which
+# are kept by the shared adapter. Shared adapter is used by many connection
+# instances (and threads) at once so it keeps more connections around than
+# the requests default (10) which is used for a single connection instance.
+# Pool doesn't block when it's exhausted, additional connections are opened
+# and discarded once they are returned.
+SHARED_POOL_CONNECTIONS = 10
+SHARED_POOL_MAXSIZE = 100
+
+# Shared HTTP adapters keyed by the SSL verification setting (``False``,
+# ``True`` or path to the CA bundle) of the connections which use them
+_shared_adapters = {}  # type: Dict[Union[bool, str], HTTPAdapter]
+_shared_adapters_lock = threading.Lock()
+
+
+def get_shared_adapter(verification=True):
+    """
+    Return HTTP adapter which is shared by all the connection instances with
+    the provided SSL verification setting when connection reuse is enabled.
+
+    urllib3 connection pools are only keyed by scheme, host and port and
+    requests updates verification settings of the pool on each request, so
+    connections with different verification settings can't share an adapter.
+
+    :param verification: SSL verification setting (``verify`` argument
+                         which is passed to requests).
+    :type verification: ``bool`` or ``str``
+
+    :rtype: :class:`requests.adapters.HTTPAdapter`
+    """
+    with _shared_adapters_lock:
+        adapter = _shared_adapters.get(verification)
+
+        if adapter is None:
+            adapter = HTTPAdapter(
+                pool_connections=SHARED_POOL_CONNECTIONS,
+                pool_maxsize=SHARED_POOL_MAXSIZE,
+                pool_block=False,
+            )
+            _shared_adapters[verification] = adapter
+
+    return adapter
+
+
+# SSL contexts with a client certificate chain and CA certificates already
+# loaded, keyed by the certificate and verification settings they were
+# created for
+_client_ssl_contexts = {}  # type: Dict[tuple, ssl.SSLContext]
+_client_ssl_contexts_lock = threading.Lock()
+
+
+def get_client_ssl_context(cert_file, key_file, cert_reqs, ca_certs, ca_cert_dir):
+    """
+    Return SSL context for the provided client certificate and verification
+    settings.
+
+    Contexts are created once and shared by all the connections, which means
+    the client certificate, the key and the CA bundle are only parsed once
+    and not for every new connection.
+
+    :rtype: :class:`ssl.SSLContext`
+    """
+    key = (cert_file, key_file, cert_reqs, ca_certs, ca_cert_dir)
+
+    with _client_ssl_contexts_lock:
+        context = _client_ssl_contexts.get(key)
+
+        if context is None:
+            context = create_urllib3_context(cert_reqs=resolve_cert_reqs(cert_reqs))
+            context.load_cert_chain(cert_file, key_file)
+
+            if ca_certs or ca_cert_dir:
+                context.load_verify_locations(ca_certs, ca_cert_dir)
+            elif context.verify_mode != ssl.CERT_NONE:
+                context.load_default_certs()
+
+            _client_ssl_contexts[key] = context
+
+    return context
+
 
 class SignedHTTPSAdapter(HTTPAdapter):
     def __init__(self, cert_file, key_file):
@@ -61,6 +157,29 @@ class SignedHTTPSAdapter(HTTPAdapter):
             key_file=self.key_file,
         )
 
+    def cert_verify(self, conn, url, verify, cert):
+        super(SignedHTTPSAdapter, self).cert_verify(conn, url, verify, cert)
+
+        if not url.lower().startswith("https") or not self.cert_file:
+            return
+
+        # Use a shared SSL context with the client certificate and the CA
+        # bundle already loaded instead of letting urllib3 load them for
+        # each new connection.
+        # NOTE: The context is created lazily so invalid certificate files
+        # only result in an error once a request is made.
+        conn.conn_kw["ssl_context"] = get_client_ssl_context(
+            cert_file=self.cert_file,
+            key_file=self.key_file,
+            cert_reqs=conn.cert_reqs,
+            ca_certs=conn.ca_certs,
+            ca_cert_dir=conn.ca_cert_dir,
+        )
+        conn.cert_file = None
+        conn.key_file = None
+        conn.ca_certs = None
+        conn.ca_cert_dir = None
+
 
 class LibcloudBaseConnection(object):
     """
@@ -82,8 +201,14 @@ class LibcloudBaseConnection(object):
 
     ca_cert = None
 
+    signing = False
+
     def __init__(self):
         self.session = requests.Session()
+        self.reuse_connections = bool(
+            os.environ.get(REUSE_CONNECTIONS_ENV_VARIABLE_NAME, False)
+        )
+        self._shared_adapter_verification = None
 
     def set_http_proxy(self, proxy_url):
         """
@@ -183,6 +308,26 @@ class LibcloudBaseConnection(object):
         adapter to the session
         """
         self.session.mount("https://", SignedHTTPSAdapter(cert_file, key_file))
+        self.signing = True
+
+    def _mount_shared_adapter(self, verification):
+        """
+        Mount shared HTTP adapter for the provided SSL verification setting
+        to the session (if it's not mounted already).
+
+        Connections which use client certificates always use their own
+        adapter for HTTPS.
+        """
+        if self._shared_adapter_verification == verification:
+            return
+
+        adapter = get_shared_adapter(verification)
+
+        if not self.signing:
+            self.session.mount("https://", adapter)
+
+        self.session.mount("http://", adapter)
+        self._shared_adapter_verification = verification
 
 
 class LibcloudConnection(LibcloudBaseConnection):
@@ -221,6 +366,9 @@ class LibcloudConnection(LibcloudBaseConnection):
         if proxy_url:
             self.set_http_proxy(proxy_url=proxy_url)
 
+        if self.reuse_connections:
+            self._mount_shared_adapter(self.verification)
+
     @property
     def verification(self):
         """
@@ -233,6 +381,12 @@ class LibcloudConnection(LibcloudBaseConnection):
     ):
         url = urlparse.urljoin(self.host, url)
         headers = self._normalize_headers(headers=headers)
+        verification = self.verification
+
+        # Verification settings can be changed after the connection has been
+        # created (e.g. by setting "ca_cert" attribute)
+        if self.reuse_connections:
+            self._mount_shared_adapter(verification)
 
         self.response = self.session.request(
             method=method.lower(),
@@ -241,7 +395,7 @@ class LibcloudConnection(LibcloudBaseConnection):
             headers=headers,
             allow_redirects=ALLOW_REDIRECTS,
             stream=stream,
-            verify=self.verification,
+            verify=verification,
             timeout=self.session.timeout,
             hooks=hooks,
         )
@@ -256,13 +410,145 @@ class LibcloudConnection(LibcloudBaseConnection):
         )
 
         prepped = self.session.prepare_request(req)
+        verification = self.verification
+
+        if self.reuse_connections:
+            self._mount_shared_adapter(verification)
 
         self.response = self.session.send(
             prepped,
             stream=stream,
-            verify=self.ca_cert if self.ca_cert is not None else self.verify,
+            verify=verification,
         )
 
+    def prewarm(self, count):
+        """
+        Open connections to the remote host in background threads and put
+        them into the connection pool so the following requests can reuse
+        them instead of establishing a new connection (and performing a TLS
+        handshake) on first use.
+
+        Errors are ignored, they will be raised by the actual request which
+        needs the connection.
+
+        :param count: Number of connections to open. It's limited by the
+                      connection pool size.
+        :type count: ``int``
+
+        :return: Thread which opens the connections or ``None`` if the
+                 connection pool couldn't be set up.
+        :rtype: :class:`threading.Thread` or ``None``
+        """
+        url = self.host + "/"
+        verification = self.verification
+
+        # NOTE: Connection pool is set up here and not in the background
+        # thread since it's shared with the requests made by this connection
+        # (and other connections if connection reuse is enabled)
+        try:
+            if self.reuse_connections:
+                self._mount_shared_adapter(verification)
+
+            pool = self._get_pool(url, verification)
+        except Exception:
+            return None
+
+        timeout = self.session.timeout
+
+        if isinstance(timeout, tuple):
+            timeout = timeout[0]
+
+        thread = threading.Thread(target=self._prewarm, args=(pool, count, timeout))
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def _get_pool(self, url, verification):
+        """
+        Return urllib3 connection pool which is used by requests for the
+        provided URL.
+        """
+        adapter = self.session.get_adapter(url)
+        proxies = self.session.proxies
+        cert = self.session.cert
+
+        # NOTE: requests >= 2.32.2 picks the pool based on the TLS settings
+        # of the request and get_connection() is deprecated there so we need
+        # to go through the same code path as HTTPAdapter.send()
+        if hasattr(adapter, "get_connection_with_tls_context"):
+            request = requests.Request("GET", url).prepare()
+            pool = adapter.get_connection_with_tls_context(
+                request, verification, proxies=proxies, cert=cert
+            )
+        else:
+            pool = adapter.get_connection(url, proxies)
+
+        adapter.cert_verify(pool, url, verification, cert)
+        return pool
+
+    def _prewarm(self, pool, count, timeout):
+        def open_connection():
+            conn = None
+
+            try:
+                conn = pool._new_conn()
+                conn.timeout = timeout
+                conn.connect()
+            except Exception:
+                if conn is not None:
+                    conn.close()
+
+                conn = None
+
+            release(conn)
+
+        def release(conn):
+            # Slot which has been reserved is always returned to the pool,
+            # either with an open connection or empty
+            try:
+                pool.pool.put(conn, block=False)
+            except Exception:
+                if conn is not None:
+                    conn.close()
+
+        # NOTE: Empty slots in the pool are reserved first so the connections
+        # which are opened can be put back without exceeding the pool size.
+        # Idle connections which are already in the pool are left alone.
+        slots = 0
+        idle = []
+
+        try:
+            while slots < count:
+                conn = pool.pool.get(block=False)
+
+                if conn is None:
+                    slots += 1
+                else:
+                    idle.append(conn)
+        except Exception:
+            pass
+
+        for conn in idle:
+            release(conn)
+
+        # NOTE: Sockets are opened in daemon threads so a connection which
+        # hangs doesn't block interpreter exit
+        threads = []
+
+        for _ in range(slots):
+            thread = threading.Thread(target=open_connection)
+            thread.daemon = True
+
+            try:
+                thread.start()
+            except Exception:
+                release(None)
+            else:
+                threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
     def getresponse(self):
         return self.response
 
@@ -309,6 +595,8 @@ class HttpLibResponseProxy(object):
     object to a :class:`httplib.HTTPResponse` object
     """
 
+    __slots__ = ("_response",)
+
     def __init__(self, response):
         self._response = response
 
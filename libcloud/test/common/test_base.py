@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import signal
 import unittest
 import sys
 
 import mock
+from requests.structures import CaseInsensitiveDict
 
+from libcloud.common import base
 from libcloud.common.base import LazyObject, Response
 from libcloud.common.exceptions import BaseHTTPError, RateLimitReachedError
 from libcloud.test import LibcloudTestCase
@@ -49,9 +53,17 @@ class LazyObjectTest(LibcloudTestCase):
     def test_setattr(self):
         a = self.A.lazy("foo", y="bar")
         a.z = "baz"
-        wrapped_lazy_obj = object.__getattribute__(a, "_lazy_obj")
         self.assertEqual(a.z, "baz")
-        self.assertEqual(wrapped_lazy_obj.z, "baz")
+        self.assertEqual(a.x, "foo")
+        self.assertEqual(a.y, "bar")
+
+    def test_proxy_is_replaced_after_init(self):
+        a = self.A.lazy("foo", y="bar")
+        self.assertIsNot(type(a), self.A)
+
+        self.assertEqual(a.x, "foo")
+        self.assertIs(type(a), self.A)
+        self.assertEqual(a.__dict__, {"x": "foo", "y": "bar"})
 
 
 class ErrorResponseTest(LibcloudTestCase):
@@ -104,5 +116,100 @@ class ErrorResponseTest(LibcloudTestCase):
             self.fail("HTTP Status 503 response didn't raised an exception")
 
 
+class ResponseTest(LibcloudTestCase):
+    def test_body_is_decoded_once(self):
+        resp_mock = mock.MagicMock()
+        resp_mock.headers = {}
+        resp_mock.status_code = 200
+        text_mock = mock.PropertyMock(return_value=" foo \n")
+        type(resp_mock).text = text_mock
+
+        response = Response(resp_mock, mock.MagicMock())
+        self.assertEqual(response.body, "foo")
+        self.assertEqual(text_mock.call_count, 1)
+
+
+class LowercaseHeadersTest(LibcloudTestCase):
+    def test_header_names_are_lowercased(self):
+        headers = {"Content-Type": "application/json", "X-Request-Id": "1"}
+        result = base._lowercase_headers(headers)
+        self.assertEqual(
+            result, {"content-type": "application/json", "x-request-id": "1"}
+        )
+
+    def test_case_insensitive_dict(self):
+        headers = CaseInsensitiveDict({"Content-Type": "text/plain", "ETag": "1"})
+        result = base._lowercase_headers(headers)
+        self.assertIs(type(result), dict)
+        self.assertEqual(result, {"content-type": "text/plain", "etag": "1"})
+
+
+class CacheBustingValueTest(LibcloudTestCase):
+    def setUp(self):
+        base._CACHE_BUSTING_POOL.clear()
+
+    def test_values_are_taken_from_pool(self):
+        with mock.patch("os.urandom", wraps=os.urandom) as mock_urandom:
+            values = [base._get_cache_busting_value() for _ in range(64)]
+            self.assertEqual(mock_urandom.call_count, 1)
+
+            base._get_cache_busting_value()
+            self.assertEqual(mock_urandom.call_count, 2)
+
+        self.assertEqual(len(set(values)), 64)
+
+        for value in values:
+            self.assertEqual(len(value), 16)
+            int(value, 16)
+
+    def test_reset_in_forked_process(self):
+        base._get_cache_busting_value()
+        self.assertTrue(base._CACHE_BUSTING_POOL)
+
+        # Lock could be held by another thread at the time of the fork
+        lock = base._CACHE_BUSTING_LOCK
+        lock.acquire()
+
+        try:
+            base._reset_cache_busting_pool()
+        finally:
+            lock.release()
+
+        self.assertIsNot(base._CACHE_BUSTING_LOCK, lock)
+        self.assertFalse(base._CACHE_BUSTING_LOCK.locked())
+        self.assertFalse(base._CACHE_BUSTING_POOL)
+        self.assertEqual(len(base._get_cache_busting_value()), 16)
+
+    @unittest.skipIf(not hasattr(os, "fork"), "os.fork() is not available")
+    def test_pool_is_reset_after_fork(self):
+        base._get_cache_busting_value()
+        read_fd, write_fd = os.pipe()
+
+        with base._CACHE_BUSTING_LOCK:
+            pid = os.fork()
+
+            if pid == 0:
+                # Child process, lock held by the parent must not block it.
+                # It must never return to the test runner, even on error.
+                exit_code = 1
+
+                try:
+                    os.close(read_fd)
+                    signal.alarm(5)
+                    result = b"1" if not base._CACHE_BUSTING_POOL else b"0"
+                    base._get_cache_busting_value()
+                    os.write(write_fd, result)
+                    exit_code = 0
+                finally:
+                    os._exit(exit_code)
+
+        os.close(write_fd)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+
+        with os.fdopen(read_fd, "rb") as fp:
+            self.assertEqual(fp.read(), b"1")
+
+
 if __name__ == "__main__":
     sys.exit(unittest.main())
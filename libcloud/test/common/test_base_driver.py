@@ -31,8 +31,8 @@ class BaseDriverTestCase(unittest.TestCase):
         DummyDriver1.connectionCls = Mock()
         DummyDriver1(key="foo")
         call_kwargs = DummyDriver1.connectionCls.call_args[1]
-        self.assertIsNone(call_kwargs["timeout"])
-        self.assertIsNone(call_kwargs["retry_delay"])
+        self.assertNotIn("timeout", call_kwargs)
+        self.assertNotIn("retry_delay", call_kwargs)
 
         # 2. Timeout provided as constructor argument
         class DummyDriver1(BaseDriver):
@@ -42,7 +42,7 @@ class BaseDriverTestCase(unittest.TestCase):
         DummyDriver1(key="foo", timeout=12)
         call_kwargs = DummyDriver1.connectionCls.call_args[1]
         self.assertEqual(call_kwargs["timeout"], 12)
-        self.assertIsNone(call_kwargs["retry_delay"])
+        self.assertNotIn("retry_delay", call_kwargs)
 
         # 3. timeout provided via "_ex_connection_class_kwargs" method
         class DummyDriver2(BaseDriver):
@@ -54,6 +54,7 @@ class BaseDriverTestCase(unittest.TestCase):
         DummyDriver2.connectionCls = Mock()
         DummyDriver2(key="foo")
         call_kwargs = DummyDriver2.connectionCls.call_args[1]
+        self.assertEqual(call_kwargs["timeout"], 13)
 
         # 4. Value provided via "_ex_connection_class_kwargs" and constructor,
         # constructor should win
@@ -63,6 +64,55 @@ class BaseDriverTestCase(unittest.TestCase):
         self.assertEqual(call_kwargs["timeout"], 14)
         self.assertEqual(call_kwargs["retry_delay"], 10)
 
+    def test_connection_is_not_established_on_init(self):
+        class DummyDriver(BaseDriver):
+            pass
+
+        DummyDriver.connectionCls = Mock()
+        driver = DummyDriver(key="foo")
+        self.assertIs(driver.connection.driver, driver)
+        self.assertFalse(driver.connection.connect.called)
+
+    def test_prewarm_argument(self):
+        class DummyDriver(BaseDriver):
+            pass
+
+        DummyDriver.connectionCls = Mock()
+        driver = DummyDriver(key="foo")
+        self.assertFalse(driver.connection.prewarm.called)
+        self.assertNotIn("prewarm", DummyDriver.connectionCls.call_args[1])
+
+        DummyDriver.connectionCls = Mock()
+        driver = DummyDriver(key="foo", prewarm=5)
+        driver.connection.prewarm.assert_called_once_with(5)
+        self.assertNotIn("prewarm", DummyDriver.connectionCls.call_args[1])
+
+    def test_create_many(self):
+        class DummyDriver(BaseDriver):
+            pass
+
+        DummyDriver.connectionCls = Mock()
+
+        self.assertEqual(DummyDriver.create_many([]), [])
+
+        configs = [{"key": "foo%s" % (i), "region": "region%s" % (i)} for i in range(5)]
+        drivers = DummyDriver.create_many(configs)
+
+        self.assertEqual(len(drivers), 5)
+
+        for i, driver in enumerate(drivers):
+            self.assertIsInstance(driver, DummyDriver)
+            self.assertEqual(driver.key, "foo%s" % (i))
+            self.assertEqual(driver.region, "region%s" % (i))
+
+    def test_create_many_error_is_propagated(self):
+        class DummyDriver(BaseDriver):
+            pass
+
+        DummyDriver.connectionCls = Mock()
+
+        self.assertRaises(TypeError, DummyDriver.create_many, [{"key": "foo"}, {}])
+
 
 if __name__ == "__main__":
     sys.exit(unittest.main())
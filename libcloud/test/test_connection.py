@@ -212,6 +212,47 @@ class BaseConnectionClassTestCase(unittest.TestCase):
             response = conn.request("/test")
         self.assertEqual(response.body, "data")
 
+    def test_connect_kwargs_take_precedence(self):
+        conn = Connection(host="test.com", secure=True)
+
+        with patch.object(conn, "conn_class") as mock_conn_class:
+            conn.connect(secure=False)
+            mock_conn_class.assert_called_once_with(
+                host="test.com", port=443, secure=False
+            )
+
+        conn = CertificateConnection(cert_file="test.pem", host="test.com")
+
+        with patch.object(conn, "conn_class") as mock_conn_class:
+            conn.connect()
+            mock_conn_class.assert_called_once_with(
+                host="test.com", port=443, secure=1, cert_file="test.pem"
+            )
+
+            mock_conn_class.reset_mock()
+            conn.connect(cert_file="other.pem")
+            mock_conn_class.assert_called_once_with(
+                host="test.com", port=443, secure=1, cert_file="other.pem"
+            )
+
+    def test_connection_is_established_lazily(self):
+        conn = Connection(host="test.com", secure=True)
+
+        with patch.object(conn, "conn_class") as mock_conn_class:
+            self.assertFalse(mock_conn_class.called)
+
+            connection = conn.connection
+            mock_conn_class.assert_called_once_with(host="test.com", port=443, secure=1)
+            self.assertIs(connection, mock_conn_class.return_value)
+
+            # Existing connection is reused
+            self.assertIs(conn.connection, connection)
+            self.assertEqual(mock_conn_class.call_count, 1)
+
+            del conn.connection
+            self.assertIsNot(conn.connection, None)
+            self.assertEqual(mock_conn_class.call_count, 2)
+
     def test_morph_action_hook(self):
         conn = Connection(url="http://test.com")
 
@@ -240,6 +281,20 @@ class BaseConnectionClassTestCase(unittest.TestCase):
 
         conn.request_path = "/b"
         self.assertEqual(conn.morph_action_hook("/foo//"), "/b/foo/")
+        self.assertEqual(conn.morph_action_hook("/foo//bar"), "/b/foo/bar")
+        self.assertEqual(conn.morph_action_hook("/a/../c.txt"), "/b/c.txt")
+        self.assertEqual(conn.morph_action_hook("/foo?a=1"), "/b/foo?a=1")
+        self.assertEqual(conn.morph_action_hook(""), "/b/")
+        self.assertEqual(conn.morph_action_hook("/foo?"), "/b/foo")
+        self.assertEqual(conn.morph_action_hook("/foo;"), "/b/foo")
+        self.assertEqual(conn.morph_action_hook("/foo;?a=1"), "/b/foo?a=1")
+        self.assertEqual(conn.morph_action_hook(" foo"), "/b/foo")
+        self.assertEqual(conn.morph_action_hook(" /foo"), "/foo")
+        self.assertEqual(conn.morph_action_hook("/\tfoo\n"), "/b/foo")
+
+        conn.request_path = ""
+        self.assertEqual(conn.morph_action_hook("?"), "/")
+        self.assertEqual(conn.morph_action_hook(" foo"), "/foo")
 
         libcloud.common.base.ALLOW_PATH_DOUBLE_SLASHES = True
 
@@ -370,6 +425,40 @@ class ConnectionClassTestCase(unittest.TestCase):
         args, kwargs = con.pre_connect_hook.call_args
         self.assertTrue("cache-busting" in args[0][len(params2)])
 
+    def test_user_agent_is_cached(self):
+        con = Connection()
+        user_agent = con._user_agent()
+        self.assertTrue(user_agent.startswith("libcloud/"))
+
+        with patch.object(con, "_build_user_agent") as mock_build:
+            self.assertEqual(con._user_agent(), user_agent)
+            mock_build.assert_not_called()
+
+        con.user_agent_append("foo")
+        self.assertTrue(con._user_agent().endswith("(foo)"))
+
+        con.driver = Mock()
+        con.driver.name = "Dummy"
+        self.assertIn("(Dummy)", con._user_agent())
+
+    def test_retry_environment_variable_is_read_once(self):
+        con = Connection()
+        con.connection = Mock()
+        con.responseCls = Mock()
+
+        with patch.dict(os.environ, {"LIBCLOUD_RETRY_FAILED_HTTP_REQUESTS": "1"}):
+            with patch.object(con, "retryCls") as mock_retry_cls:
+                con.request("/")
+                self.assertEqual(mock_retry_cls.call_count, 1)
+
+        self.assertTrue(con._retry_env_enabled)
+
+        with patch.object(os.environ, "get") as mock_get:
+            with patch.object(con, "retryCls") as mock_retry_cls:
+                con.request("/")
+                self.assertEqual(mock_retry_cls.call_count, 1)
+            mock_get.assert_not_called()
+
     def test_context_is_reset_after_request_has_finished(self):
         context = {"foo": "bar"}
 
@@ -17,13 +17,17 @@ import os
 import sys
 import os.path
 import random
+import socket
 import platform
+import subprocess
 import warnings
 import threading
 import time
+from unittest import mock
 
 from http.server import BaseHTTPRequestHandler
 from http.server import HTTPServer
+from http.server import ThreadingHTTPServer
 
 import requests
 
@@ -33,6 +37,8 @@ from libcloud.utils.py3 import httplib
 from libcloud.utils.py3 import reload
 from libcloud.utils.py3 import assertRaisesRegex
 from libcloud.http import LibcloudConnection
+from libcloud.http import get_shared_adapter
+from libcloud.http import SignedHTTPSAdapter
 
 from libcloud.test import unittest
 
@@ -97,6 +103,140 @@ class TestHttpLibSSLTests(unittest.TestCase):
 
         self.assertTrue(self.httplib_object.ca_cert is not None)
 
+    def test_connections_share_adapter_if_reuse_is_enabled(self):
+        url = "https://foo.bar"
+
+        with mock.patch.dict(os.environ, {"LIBCLOUD_REUSE_CONNECTIONS": "1"}):
+            connection1 = LibcloudConnection("foo.bar", port=443)
+            connection2 = LibcloudConnection("foo.bar", port=443)
+
+        adapter = connection1.session.get_adapter(url)
+        self.assertIs(adapter, get_shared_adapter(False))
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 100)
+        self.assertFalse(adapter.poolmanager.connection_pool_kw["block"])
+        self.assertIs(adapter, connection2.session.get_adapter(url))
+        self.assertIs(adapter, connection2.session.get_adapter("http://foo.bar"))
+
+        with mock.patch.dict(os.environ, {}, clear=True):
+            connection3 = LibcloudConnection("foo.bar", port=443)
+
+        self.assertIsNot(connection3.session.get_adapter(url), adapter)
+
+    def test_shared_adapter_depends_on_verification(self):
+        url = "https://foo.bar"
+
+        with mock.patch.dict(os.environ, {"LIBCLOUD_REUSE_CONNECTIONS": "1"}):
+            connection1 = LibcloudConnection("foo.bar", port=443)
+            connection2 = LibcloudConnection("foo.bar", port=443)
+
+        self.assertIs(
+            connection1.session.get_adapter(url), connection2.session.get_adapter(url)
+        )
+
+        # Verification settings are changed after the connection has been
+        # created
+        connection2.verify = True
+        connection2.ca_cert = ORIGINAL_CA_CERTS_PATH
+
+        with mock.patch.object(connection2.session, "request"):
+            connection2.request("GET", "/")
+
+        adapter1 = connection1.session.get_adapter(url)
+        adapter2 = connection2.session.get_adapter(url)
+        self.assertIs(adapter1, get_shared_adapter(False))
+        self.assertIs(adapter2, get_shared_adapter(ORIGINAL_CA_CERTS_PATH))
+        self.assertIsNot(adapter1, adapter2)
+
+    def test_shared_adapter_is_not_used_for_client_certificates(self):
+        with mock.patch.dict(os.environ, {"LIBCLOUD_REUSE_CONNECTIONS": "1"}):
+            connection = LibcloudConnection(
+                "foo.bar", port=443, cert_file="/tmp/cert.pem", key_file="/tmp/key.pem"
+            )
+
+        self.assertIsInstance(
+            connection.session.get_adapter("https://foo.bar"), SignedHTTPSAdapter
+        )
+        self.assertIs(
+            connection.session.get_adapter("http://foo.bar"), get_shared_adapter(False)
+        )
+
+    def test_prewarm_errors_are_ignored(self):
+        libcloud.security.VERIFY_SSL_CERT = True
+        connection = LibcloudConnection(
+            "foo.bar",
+            port=443,
+            cert_file="/doesnt/exist/cert.pem",
+            key_file="/doesnt/exist/key.pem",
+        )
+
+        with mock.patch.dict("libcloud.http._client_ssl_contexts", clear=True):
+            self.assertIsNone(connection.prewarm(2))
+
+    def test_prewarm_doesnt_block_interpreter_exit(self):
+        # Server accepts TCP connections, but never completes the TLS handshake
+        server = socket.socket()
+        server.bind(("127.0.0.1", 0))
+        server.listen(5)
+        self.addCleanup(server.close)
+
+        script = (
+            "import time\n"
+            "import libcloud.security\n"
+            "from libcloud.http import LibcloudConnection\n"
+            "libcloud.security.VERIFY_SSL_CERT = False\n"
+            "connection = LibcloudConnection(\n"
+            "    '127.0.0.1', port=%d, secure=True, timeout=60\n"
+            ")\n"
+            "connection.prewarm(2)\n"
+            "time.sleep(0.5)\n" % (server.getsockname()[1])
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        env.pop("SSL_CERT_FILE", None)
+
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", script], env=env, timeout=30, check=True)
+        self.assertLess(time.monotonic() - start, 20)
+
+    def test_signed_adapter_shares_ssl_context(self):
+        adapter1 = SignedHTTPSAdapter(
+            cert_file="/tmp/cert.pem", key_file="/tmp/key.pem"
+        )
+        adapter2 = SignedHTTPSAdapter(
+            cert_file="/tmp/cert.pem", key_file="/tmp/key.pem"
+        )
+        pool1 = adapter1.get_connection("https://foo.bar")
+        pool2 = adapter2.get_connection("https://foo.bar")
+
+        with mock.patch.dict(
+            "libcloud.http._client_ssl_contexts", clear=True
+        ), mock.patch("libcloud.http.ssl.SSLContext.load_cert_chain") as load:
+            adapter1.cert_verify(pool1, "https://foo.bar", False, None)
+            adapter2.cert_verify(pool2, "https://foo.bar", False, None)
+
+        # Certificate chain is only loaded once and urllib3 doesn't load it
+        # again for each new connection
+        load.assert_called_once_with("/tmp/cert.pem", "/tmp/key.pem")
+        self.assertIs(pool1.conn_kw["ssl_context"], pool2.conn_kw["ssl_context"])
+        self.assertIsNone(pool1.cert_file)
+        self.assertIsNone(pool1.key_file)
+
+    def test_signed_adapter_ssl_context_loads_ca_bundle_once(self):
+        adapter = SignedHTTPSAdapter(cert_file="/tmp/cert.pem", key_file="/tmp/key.pem")
+        pool = adapter.get_connection("https://foo.bar")
+        ca_cert = os.path.abspath(__file__)
+
+        with mock.patch.dict(
+            "libcloud.http._client_ssl_contexts", clear=True
+        ), mock.patch("libcloud.http.ssl.SSLContext.load_cert_chain"), mock.patch(
+            "libcloud.http.ssl.SSLContext.load_verify_locations"
+        ) as load:
+            adapter.cert_verify(pool, "https://foo.bar", ca_cert, None)
+            adapter.cert_verify(pool, "https://foo.bar", ca_cert, None)
+
+        load.assert_called_once_with(ca_cert, None)
+        self.assertIsNone(pool.ca_certs)
+        self.assertIsNone(pool.ca_cert_dir)
+
 
 @unittest.skipIf(
     platform.python_implementation() == "PyPy",
@@ -145,6 +285,42 @@ class HttpLayerTestCase(unittest.TestCase):
         self.assertEqual(connection.response.status_code, httplib.OK)
         self.assertEqual(connection.response.content, b"/test/prepared-request-3")
 
+    def test_prewarm(self):
+        server = ThreadingHTTPServer(
+            (self.listen_host, 0), CountingHTTPServerRequestHandler
+        )
+        server.daemon_threads = True
+        server.connections = 0
+
+        server_thread = threading.Thread(target=server.serve_forever)
+        server_thread.daemon = True
+        server_thread.start()
+
+        try:
+            connection = LibcloudConnection(
+                host=self.listen_host, port=server.server_address[1]
+            )
+            connection.prewarm(3).join()
+
+            # Connections are accepted by the server in a separate thread
+            for _ in range(50):
+                if server.connections == 3:
+                    break
+
+                time.sleep(0.1)
+
+            self.assertEqual(server.connections, 3)
+
+            # Request reuses one of the pre-warmed connections
+            connection.request(method="GET", url="/test")
+            self.assertEqual(connection.response.status_code, httplib.OK)
+            self.assertEqual(server.connections, 3)
+
+            connection.session.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
     def test_request_custom_timeout_no_timeout(self):
         def response_hook(*args, **kwargs):
             # Assert timeout has been passed correctly
@@ -218,5 +394,21 @@ class MockHTTPServerRequestHandler(BaseHTTPRequestHandler):
             self.end_headers()
 
 
+class CountingHTTPServerRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self):
+        self.send_response(requests.codes.ok)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
 if __name__ == "__main__":
     sys.exit(unittest.main())
@@ -74,6 +74,31 @@ class ResponseClassesTests(unittest.TestCase):
         parsed = response.parse_body()
         self.assertEqual(parsed, {"foo": "bar"})
 
+    def test_JsonResponse_class_big_integer(self):
+        with requests_mock.mock() as m:
+            m.register_uri(
+                "GET", "mock://test.com/", text='{"foo": 99999999999999999999}'
+            )
+            response_obj = requests.get("mock://test.com/")
+            response = JsonResponse(
+                response=response_obj, connection=self.mock_connection
+            )
+
+        self.assertEqual(response.object, {"foo": 99999999999999999999})
+        self.assertIs(type(response.object["foo"]), int)
+
+        # Negative integers with 19 digits can be below the int64 minimum
+        for value in [-9999999999999999999, -9223372036854775809]:
+            with requests_mock.mock() as m:
+                m.register_uri("GET", "mock://test.com/", text='{"foo": %d}' % (value))
+                response_obj = requests.get("mock://test.com/")
+                response = JsonResponse(
+                    response=response_obj, connection=self.mock_connection
+                )
+
+            self.assertEqual(response.object, {"foo": value})
+            self.assertIs(type(response.object["foo"]), int)
+
     def test_JsonResponse_class_malformed_response(self):
         with requests_mock.mock() as m:
             m.register_uri("GET", "mock://test.com/", text='{"foo": "bar"')